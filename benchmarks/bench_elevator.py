@@ -0,0 +1,64 @@
+import os
+import random
+
+from harness import REPO_ROOT, BenchmarkRunner, subsystem
+
+CODE_DIR = os.path.join(REPO_ROOT, "design-problems", "elevator-system", "code")
+SUITE = "elevator"
+
+
+def run(runner: BenchmarkRunner, buildings: list, request_rates: list, iterations: int, seed: int = 42):
+    with subsystem(CODE_DIR):
+        from enums import Direction
+        from Building import Building
+        from DispatchStrategy import NearestIdleStrategy
+        from ElevatorSystem import ElevatorSystem
+
+        strategy = NearestIdleStrategy()
+
+        def spread_cars(cars, num_floors, rng):
+            for car in cars:
+                car.current_floor = rng.randrange(num_floors)
+            for car in rng.sample(cars, len(cars) // 10):
+                car.enter_maintenance()
+
+        def build_fleet(num_floors, num_cars):
+            rng = random.Random(seed)
+            building = Building(num_floors, num_cars)
+            spread_cars(building.get_cars(), num_floors, rng)
+            floors = [rng.randrange(num_floors) for _ in range(iterations)]
+            return building, floors
+
+        def select_car(state, i):
+            building, floors = state
+            strategy.select_car(building, floors[i])
+
+        def build_system(num_floors, num_cars, rate):
+            ElevatorSystem._instance = None
+            rng = random.Random(seed)
+            system = ElevatorSystem.get_instance(num_floors, num_cars, strategy)
+            spread_cars(system.get_cars(), num_floors, rng)
+            calls = [[(rng.randrange(num_floors), rng.choice((Direction.UP, Direction.DOWN)))
+                      for _ in range(rate)] for _ in range(iterations)]
+            return system, calls
+
+        def dispatch(state, i):
+            system, calls = state
+            for floor, direction in calls[i]:
+                system.call_elevator(floor, direction)
+            system.dispatcher()
+
+        for num_floors, num_cars in buildings:
+            params = {"floors": num_floors, "cars": num_cars}
+            runner.measure(SUITE, "build_building", params, lambda: Building(num_floors, num_cars),
+                           lambda _, i: Building(num_floors, num_cars), max(1, iterations // 100))
+            runner.measure(SUITE, "fork_building", params, lambda: Building(num_floors, num_cars),
+                           lambda building, i: building.fork(), iterations)
+            runner.measure(SUITE, "select_car", params,
+                           lambda: build_fleet(num_floors, num_cars), select_car, iterations)
+            for rate in request_rates:
+                runner.measure(SUITE, "dispatch", {**params, "requests_per_cycle": rate},
+                               lambda: build_system(num_floors, num_cars, rate), dispatch,
+                               max(1, iterations // 10))
+
+        ElevatorSystem._instance = None
@@ -0,0 +1,148 @@
+import gc
+import os
+import random
+import tempfile
+import time
+
+from harness import REPO_ROOT, BenchmarkRunner, subsystem
+
+CODE_DIR = os.path.join(REPO_ROOT, "design-problems", "parking-lot-system", "code")
+SUITE = "parking"
+DAY = 24 * 3600
+
+
+def run(runner: BenchmarkRunner, lot_sizes: list, iterations: int, saturations: list = (0.5, 0.99),
+        fill: float = 0.9, seed: int = 42):
+    with subsystem(CODE_DIR):
+        from enums import VehicleType
+        from CashPayment import CashPayment
+        from HourlyPricing import HourlyPricing
+        from LayoutLoader import LayoutLoader
+        from LotSnapshot import LotSnapshot
+        from ParkingLotSystem import ParkingLotSystem
+        from ParkingSpot import ParkingSpot
+        from Vehicle import Vehicle
+
+        rates = {VehicleType.BIKE: 20, VehicleType.CAR: 50, VehicleType.TRUCK: 100}
+
+        def new_system():
+            ParkingLotSystem._instance = None
+            return ParkingLotSystem.get_instance(HourlyPricing(rates), CashPayment())
+
+        def build_lot(lot_size):
+            # handle_entry hands out spots first-fit, so a lot that has been
+            # filling up all day has its occupied spots at the front.
+            system = new_system()
+            system.add_spots([ParkingSpot(i, VehicleType.CAR, i // 1000) for i in range(lot_size)])
+            for spot in system.spots[:int(lot_size * fill)]:
+                spot.mark_occupied()
+            return system
+
+        car = Vehicle("KA-01-1234", VehicleType.CAR)
+
+        def entry(system, i):
+            ticket = system.handle_entry(car)
+            ticket.get_spot().release()
+
+        def visit(system, i):
+            system.handle_exit(system.handle_entry(car))
+
+        def build_bookings(lot_size):
+            # Corporate bookings of 1-9 hours spread over the next 30 days.
+            rng = random.Random(seed)
+            base = time.time() + DAY
+            windows = []
+            for _ in range(iterations):
+                start = base + rng.randrange(0, 30 * DAY, 900)
+                windows.append((start, start + rng.choice((1, 2, 4, 9)) * 3600))
+            system = new_system()
+            system.add_spots([ParkingSpot(i, VehicleType.CAR) for i in range(lot_size)])
+            return system, windows
+
+        def reserve(state, i):
+            system, windows = state
+            start, end = windows[i]
+            system.reserve(f"CORP-{i}", VehicleType.CAR, start, end)
+
+        def build_saturated(lot_size, saturation):
+            # A busy event day: a share of the pool is already booked for
+            # 09:00-18:00, and every new booking overlaps that window. Once
+            # the remaining spots are taken, every reserve() fails.
+            rng = random.Random(seed)
+            day_start = (int(time.time()) // DAY + 1) * DAY + 9 * 3600
+            system = new_system()
+            system.add_spots([ParkingSpot(i, VehicleType.CAR) for i in range(lot_size)])
+            for i in range(int(lot_size * saturation)):
+                system.reserve(f"EVENT-{i}", VehicleType.CAR, day_start, day_start + 9 * 3600)
+            windows = []
+            for _ in range(iterations):
+                start = day_start + rng.randrange(0, 8 * 3600, 900)
+                windows.append((start, start + rng.choice((1, 2, 4)) * 3600))
+            return system, windows
+
+        for lot_size in lot_sizes:
+            params = {"lot_size": lot_size}
+            runner.measure(SUITE, "handle_entry", {**params, "fill": fill},
+                           lambda: build_lot(lot_size), entry, iterations)
+            runner.measure(SUITE, "entry_exit", {**params, "fill": fill},
+                           lambda: build_lot(lot_size), visit, iterations)
+            runner.measure(SUITE, "reserve", params,
+                           lambda: build_bookings(lot_size), reserve, iterations)
+            for saturation in saturations:
+                runner.measure(SUITE, "reserve_saturated", {**params, "saturation": saturation},
+                               lambda: build_saturated(lot_size, saturation), reserve, iterations)
+
+        def add_one_by_one(lot_size):
+            system = new_system()
+            for i in range(lot_size):
+                system.add_spot(ParkingSpot(i, VehicleType.CAR, i // 1000))
+            return system
+
+        with tempfile.TemporaryDirectory() as workdir:
+            csv_path = os.path.join(workdir, "layout.csv")
+            layout_path = os.path.join(workdir, "layout.bin")
+            snapshot_path = os.path.join(workdir, "lot.snap")
+
+            def load_csv():
+                system = new_system()
+                system.add_spots(LayoutLoader.load_csv(csv_path))
+                return system
+
+            def load_layout():
+                system = new_system()
+                system.add_spots(LayoutLoader.load_binary(layout_path))
+                return system
+
+            def restore_snapshot():
+                system = new_system()
+                LotSnapshot.restore(system, snapshot_path)
+                return system
+
+            def prepared(lot_size, load):
+                # Write the input files, then load the lot once so the
+                # recorded setup memory is that of a loaded lot.
+                def setup():
+                    system = build_lot(lot_size)
+                    LayoutLoader.save_csv(system.spots, csv_path)
+                    LayoutLoader.save_binary(system.spots, layout_path)
+                    LotSnapshot.save(system, snapshot_path)
+                    ParkingLotSystem._instance = None
+                    system = None
+                    gc.collect()  # spots and their table reference each other
+                    return load()
+                return setup
+
+            for lot_size in lot_sizes:
+                params = {"lot_size": lot_size}
+                runner.measure(SUITE, "add_spot_loop", params, lambda: add_one_by_one(lot_size),
+                               lambda _, i: add_one_by_one(lot_size), 3)
+                runner.measure(SUITE, "load_csv", params, prepared(lot_size, load_csv),
+                               lambda _, i: load_csv(), 3)
+                runner.measure(SUITE, "load_layout", params, prepared(lot_size, load_layout),
+                               lambda _, i: load_layout(), 3)
+                runner.measure(SUITE, "save_snapshot", params, lambda: build_lot(lot_size),
+                               lambda system, i: LotSnapshot.save(system, snapshot_path), 3)
+                runner.measure(SUITE, "restore_snapshot", params, prepared(lot_size, restore_snapshot),
+                               lambda _, i: restore_snapshot(), 3)
+
+        ParkingLotSystem._instance = None
@@ -0,0 +1,41 @@
+import os
+import random
+
+from harness import REPO_ROOT, BenchmarkRunner, subsystem
+
+CODE_DIR = os.path.join(REPO_ROOT, "solid-principles")
+SUITE = "solid"
+
+
+def run(runner: BenchmarkRunner, fleet_sizes: list, iterations: int, seed: int = 42):
+    with subsystem(CODE_DIR):
+        from car import Car
+        from electric_car import ElectricCar
+        from insurance_calculator import InsuranceCalculator
+        from object_formatter import ObjectFormatter
+        from truck import Truck
+
+        formatter = ObjectFormatter()
+        calculator = InsuranceCalculator()
+
+        def build_fleet(fleet_size):
+            rng = random.Random(seed)
+            models = [(Car, "Toyota", "Camry"), (Truck, "Ford", "F-150"), (ElectricCar, "Tesla", "Model 3")]
+            fleet = []
+            for _ in range(fleet_size):
+                cls, make, model = rng.choice(models)
+                fleet.append(cls(make, model, rng.randrange(1980, 2025)))
+            return fleet
+
+        def format_vehicle(fleet, i):
+            formatter.vehicle_to_json(fleet[i % len(fleet)])
+
+        def price_vehicle(fleet, i):
+            calculator.calculate_vehicle_insurance(fleet[i % len(fleet)])
+
+        for fleet_size in fleet_sizes:
+            params = {"fleet_size": fleet_size}
+            runner.measure(SUITE, "vehicle_to_json", params, lambda: build_fleet(fleet_size),
+                           format_vehicle, iterations)
+            runner.measure(SUITE, "insurance", params, lambda: build_fleet(fleet_size),
+                           price_vehicle, iterations)
@@ -0,0 +1,118 @@
+import cProfile
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, redirect_stdout
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@contextmanager
+def subsystem(code_dir: str):
+    # Each module uses flat imports (from enums import ...) and two of them
+    # ship their own enums.py, so every subsystem gets its own sys.path entry
+    # and its modules are dropped again afterwards.
+    code_dir = os.path.abspath(code_dir)
+    sys.path.insert(0, code_dir)
+    try:
+        yield
+    finally:
+        sys.path.remove(code_dir)
+        for name, module in list(sys.modules.items()):
+            path = getattr(module, "__file__", None) or ""
+            if os.path.dirname(os.path.abspath(path)) == code_dir:
+                del sys.modules[name]
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+class BenchmarkRunner:
+    def __init__(self, profile_dir: str = None, trace_allocations: bool = False, top_allocations: int = 10,
+                 only: set = None):
+        self.only = only
+        self.profile_dir = profile_dir
+        self.trace_allocations = trace_allocations
+        self.top_allocations = top_allocations
+        self.results = []
+
+    def measure(self, suite: str, name: str, params: dict, setup, op, iterations: int):
+        """Time `op(state, i)` once per iteration on the state built by `setup()`.
+
+        Subsystem code prints to stdout, so all of it runs with stdout
+        discarded. The memory figure is what `setup()` allocated; it is
+        always recorded because tracing only runs while the state is built.
+        """
+        if self.only and name not in self.only:
+            return None
+
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            tracemalloc.start()
+            state = setup()
+            setup_bytes = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+
+            profiler = cProfile.Profile() if self.profile_dir else None
+            if self.trace_allocations:
+                tracemalloc.start()
+            if profiler:
+                profiler.enable()
+
+            latencies = []
+            clock = time.perf_counter_ns
+            begin = clock()
+            for i in range(iterations):
+                start = clock()
+                op(state, i)
+                latencies.append(clock() - start)
+            total_ns = clock() - begin
+
+            if profiler:
+                profiler.disable()
+            allocations = self.collect_allocations() if self.trace_allocations else None
+
+        latencies.sort()
+        result = {
+            "suite": suite,
+            "name": name,
+            "params": params,
+            "iterations": iterations,
+            "mean_us": sum(latencies) / len(latencies) / 1000,
+            "p50_us": percentile(latencies, 50) / 1000,
+            "p95_us": percentile(latencies, 95) / 1000,
+            "p99_us": percentile(latencies, 99) / 1000,
+            "max_us": latencies[-1] / 1000,
+            "ops_per_sec": iterations / (total_ns / 1e9) if total_ns else 0.0,
+            "setup_bytes": setup_bytes,
+            "instrumented": bool(profiler) or self.trace_allocations,
+        }
+        if profiler:
+            result["profile"] = self.dump_profile(profiler, suite, name, params)
+        if allocations is not None:
+            result["allocations"] = allocations
+
+        self.results.append(result)
+        return result
+
+    def collect_allocations(self) -> dict:
+        # Leave out the harness's own bookkeeping (the latency list).
+        snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, __file__)])
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        top = snapshot.statistics("lineno")[:self.top_allocations]
+        return {
+            "peak_bytes": peak,
+            "top": [{"where": str(stat.traceback[0]), "bytes": stat.size, "count": stat.count} for stat in top],
+        }
+
+    def dump_profile(self, profiler: cProfile.Profile, suite: str, name: str, params: dict) -> str:
+        os.makedirs(self.profile_dir, exist_ok=True)
+        slug = "-".join(f"{k}{v}" for k, v in params.items())
+        path = os.path.join(self.profile_dir, f"{suite}-{name}-{slug}.prof")
+        profiler.dump_stats(path)
+        return path
@@ -0,0 +1,151 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import bench_elevator
+import bench_parking
+import bench_solid
+from harness import REPO_ROOT, BenchmarkRunner
+
+SUITES = ("parking", "elevator", "solid")
+
+
+def int_list(text: str) -> list:
+    return [int(x) for x in text.split(",") if x]
+
+
+def fraction_list(text: str) -> list:
+    fractions = [float(x) for x in text.split(",") if x]
+    if any(not 0 <= f <= 1 for f in fractions):
+        raise argparse.ArgumentTypeError(f"expected fractions between 0 and 1, got {text!r}")
+    return fractions
+
+
+def building_list(text: str) -> list:
+    # "10x3,50x10" -> [(10, 3), (50, 10)]  (floors x cars)
+    buildings = []
+    for pair in text.split(","):
+        if not pair:
+            continue
+        try:
+            floors, cars = (int(n) for n in pair.split("x"))
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"expected FLOORSxCARS, got {pair!r}")
+        if floors < 1 or cars < 1:
+            raise argparse.ArgumentTypeError(f"a building needs at least 1 floor and 1 car, got {pair!r}")
+        buildings.append((floors, cars))
+    return buildings
+
+
+def git_commit() -> str:
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True)
+        return out.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def result_key(result: dict) -> str:
+    return json.dumps([result["suite"], result["name"], result["params"]], sort_keys=True)
+
+
+def compare(results: list, baseline_path: str, threshold: float) -> list:
+    with open(baseline_path) as f:
+        baseline = {result_key(r): r for r in json.load(f)["results"]}
+
+    regressions = []
+    for result in results:
+        before = baseline.get(result_key(result))
+        # Profiled or traced runs are slower by design, so they never count.
+        if before is None or before["instrumented"] or result["instrumented"]:
+            continue
+        for metric, worse_if_higher in (("p50_us", True), ("p99_us", True), ("ops_per_sec", False)):
+            old, new = before[metric], result[metric]
+            if not old:
+                continue
+            change = (new - old) / old
+            if (change > threshold) if worse_if_higher else (change < -threshold):
+                regressions.append((result, metric, old, new, change))
+    return regressions
+
+
+def print_table(results: list):
+    print(f"{'suite':<9}{'benchmark':<18}{'params':<42}{'p50 us':>10}{'p95 us':>10}{'p99 us':>10}"
+          f"{'ops/s':>12}{'setup KB':>10}")
+    for r in results:
+        params = " ".join(f"{k}={v}" for k, v in r["params"].items())
+        print(f"{r['suite']:<9}{r['name']:<18}{params:<42}{r['p50_us']:>10.1f}{r['p95_us']:>10.1f}"
+              f"{r['p99_us']:>10.1f}{r['ops_per_sec']:>12.0f}{r['setup_bytes'] / 1024:>10.0f}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the parking lot, elevator and SOLID modules.")
+    parser.add_argument("--suites", default=",".join(SUITES), help="comma-separated subset of: " + ", ".join(SUITES))
+    parser.add_argument("--only", help="comma-separated benchmark names to run, e.g. load_layout,restore_snapshot")
+    parser.add_argument("--iterations", type=int, default=2000, help="operations timed per benchmark")
+    parser.add_argument("--lot-sizes", type=int_list, default=[1000, 10000, 100000])
+    parser.add_argument("--saturations", type=fraction_list, default=[0.5, 0.99],
+                        help="share of the lot already booked for the same day in reserve_saturated")
+    parser.add_argument("--buildings", type=building_list, default=[(10, 3), (50, 10), (200, 50)],
+                        help="floors x cars, e.g. 10x3,200x50")
+    parser.add_argument("--request-rates", type=int_list, default=[1, 10],
+                        help="hall calls queued per dispatcher cycle")
+    parser.add_argument("--fleet-sizes", type=int_list, default=[100, 10000])
+    parser.add_argument("--output", default="bench_results.json", help="machine-readable results file")
+    parser.add_argument("--compare", metavar="BASELINE", help="results file from an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.20, help="relative change counted as a regression")
+    parser.add_argument("--profile", metavar="DIR", help="write a cProfile .prof file per benchmark into DIR")
+    parser.add_argument("--trace-allocations", action="store_true",
+                        help="record tracemalloc peak and top allocation sites during timing")
+    args = parser.parse_args(argv)
+
+    suites = [s for s in args.suites.split(",") if s]
+    unknown = set(suites) - set(SUITES)
+    if unknown:
+        parser.error(f"unknown suites: {', '.join(sorted(unknown))}")
+
+    only = set(args.only.split(",")) if args.only else None
+    runner = BenchmarkRunner(profile_dir=args.profile, trace_allocations=args.trace_allocations, only=only)
+    started = time.time()
+    if "parking" in suites:
+        bench_parking.run(runner, args.lot_sizes, args.iterations, args.saturations)
+    if "elevator" in suites:
+        bench_elevator.run(runner, args.buildings, args.request_rates, args.iterations)
+    if "solid" in suites:
+        bench_solid.run(runner, args.fleet_sizes, args.iterations)
+
+    print_table(runner.results)
+    if args.profile or args.trace_allocations:
+        print("\nNote: profiling/allocation tracing was on, so timings are inflated.")
+
+    report = {
+        "started": started,
+        "duration_s": time.time() - started,
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "argv": sys.argv[1:] if argv is None else argv,
+        "results": runner.results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {os.path.abspath(args.output)}")
+
+    if args.compare:
+        regressions = compare(runner.results, args.compare, args.threshold)
+        for result, metric, old, new, change in regressions:
+            params = " ".join(f"{k}={v}" for k, v in result["params"].items())
+            print(f"REGRESSION {result['suite']}/{result['name']} [{params}] {metric}: "
+                  f"{old:.1f} -> {new:.1f} ({change:+.0%})")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%} against {args.compare}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
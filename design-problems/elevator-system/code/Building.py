@@ -1,14 +1,30 @@
+from BuildingState import BuildingState, ViewList
 from Floor import Floor
 from ElevatorCar import ElevatorCar
 
 class Building:
-    def __init__(self, num_floors, num_cars):
+    def __init__(self, num_floors, num_cars, state=None):
+        self.state = state if state is not None else BuildingState(num_floors, num_cars)
         top_floor = num_floors - 1
-        self.floors = [Floor(i, top_floor) for i in range(num_floors)]
-        self.cars = [ElevatorCar(i, num_floors) for i in range(num_cars)]
+        # Floors hold no state of their own, so they are created on access
+        self.floors = ViewList(num_floors, lambda i: Floor(i, top_floor, self.state))
+        self.cars = [ElevatorCar(i, num_floors, self.state) for i in range(num_cars)]
 
     def get_floors(self):
         return self.floors
 
     def get_cars(self):
         return self.cars
+
+    def get_state(self):
+        return self.state
+
+    def snapshot(self):
+        return self.state.copy()
+
+    def restore(self, snapshot):
+        self.state.restore(snapshot)
+
+    def fork(self):
+        """A new Building over a copy of this one's state, for what-if lookahead."""
+        return Building(self.state.num_floors, self.state.num_cars, self.state.copy())
@@ -0,0 +1,79 @@
+from array import array
+from collections.abc import Sequence
+from enums import ElevatorState, Direction, DoorState
+
+ELEVATOR_STATES = {s.value: s for s in ElevatorState}
+DIRECTIONS = {d.value: d for d in Direction}
+DOOR_STATES = {d.value: d for d in DoorState}
+
+class BuildingState:
+    # All mutable state of a building lives in flat arrays here. Cars,
+    # doors, displays, floors and buttons are thin views that read and
+    # write their slot, so copying a building is copying a few arrays.
+    FIELDS = (
+        'car_floor', 'car_state', 'car_load', 'car_overloaded', 'car_maintenance', 'door_state',
+        'display_floor', 'display_direction', 'display_state',
+        'car_buttons', 'door_buttons', 'emergency_buttons', 'hall_buttons',
+    )
+
+    def __init__(self, num_floors, num_cars):
+        self.num_floors = num_floors
+        self.num_cars = num_cars
+
+        self.car_floor = array('i', [0]) * num_cars
+        self.car_state = array('b', [ElevatorState.IDLE.value]) * num_cars
+        self.car_load = array('d', [0.0]) * num_cars
+        self.car_overloaded = array('b', [0]) * num_cars
+        self.car_maintenance = array('b', [0]) * num_cars
+        self.door_state = array('b', [DoorState.CLOSED.value]) * num_cars
+
+        # One display per car, then one per floor
+        num_displays = num_cars + num_floors
+        self.display_floor = array('i', [0]) * num_displays
+        self.display_direction = array('b', [Direction.IDLE.value]) * num_displays
+        self.display_state = array('b', [ElevatorState.IDLE.value]) * num_displays
+
+        # Button bitmaps: bit f of car_buttons[c] is the floor f button in car c,
+        # bit f of hall_buttons[0] / [1] is the UP / DOWN button on floor f.
+        self.car_buttons = [0] * num_cars
+        self.door_buttons = [0] * num_cars  # bit 0: open, bit 1: close
+        self.emergency_buttons = [0] * num_cars
+        self.hall_buttons = [0, 0]
+
+    def floor_display_index(self, floor_number):
+        return self.num_cars + floor_number
+
+    def copy(self):
+        clone = BuildingState.__new__(BuildingState)
+        clone.num_floors = self.num_floors
+        clone.num_cars = self.num_cars
+        for name in BuildingState.FIELDS:
+            setattr(clone, name, getattr(self, name)[:])
+        return clone
+
+    def restore(self, snapshot):
+        # Copy in place so existing views stay bound to this state
+        if (snapshot.num_floors, snapshot.num_cars) != (self.num_floors, self.num_cars):
+            raise ValueError("Snapshot is from a building of a different size.")
+        for name in BuildingState.FIELDS:
+            getattr(self, name)[:] = getattr(snapshot, name)
+
+class ViewList(Sequence):
+    # A read-only list of views, each created the first time it is accessed
+    # and then kept, so building.get_floors()[0] is always the same object
+    def __init__(self, length, make_view):
+        self.length = length
+        self.make_view = make_view
+        self.views = [None] * length
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(self.length)[i]]
+        i = range(self.length)[i]
+        view = self.views[i]
+        if view is None:
+            view = self.views[i] = self.make_view(i)
+        return view
@@ -1,12 +1,27 @@
 class Button:
-    def __init__(self):
-        self.pressed = False
+    def __init__(self, bits=None, slot=0, bit=1):
+        # The pressed flag is one bit of bits[slot], so a building can keep
+        # all buttons of a kind in a few bitmaps (see BuildingState).
+        self.bits = bits if bits is not None else [0]
+        self.slot = slot
+        self.bit = bit
+
+    @property
+    def pressed(self):
+        return bool(self.bits[self.slot] & self.bit)
+
+    @pressed.setter
+    def pressed(self, flag):
+        if flag:
+            self.press_down()
+        else:
+            self.reset()
 
     def press_down(self):
-        self.pressed = True
+        self.bits[self.slot] |= self.bit
 
     def reset(self):
-        self.pressed = False
+        self.bits[self.slot] &= ~self.bit
 
     def is_pressed(self):
         raise NotImplementedError("Must be implemented by subclasses")
@@ -2,20 +2,26 @@ from abc import ABC, abstractmethod
 from enums import ElevatorState
 
 class DispatchStrategy(ABC):
+    # Strategies get the whole Building, so they can read its state or
+    # fork() it to try out candidate assignments before picking a car.
     @abstractmethod
-    def select_car(self, cars, floor):
+    def select_car(self, building, floor):
         pass
 
 class NearestIdleStrategy(DispatchStrategy):
-    def select_car(self, cars, floor):
+    def select_car(self, building, floor):
+        state = building.get_state()
         best = None
         min_dist = float('inf')
-        for car in cars:
-            if (car.get_state() == ElevatorState.IDLE
-                and not car.is_in_maintenance()
-                and not car.is_overloaded()):
-                dist = abs(car.get_current_floor() - floor)
+        idle = ElevatorState.IDLE.value
+        # Car i lives in slot i of the state arrays; reading them directly
+        # keeps this fast, since it runs for every hall call
+        for i in range(state.num_cars):
+            if (state.car_state[i] == idle
+                and not state.car_maintenance[i]
+                and not state.car_overloaded[i]):
+                dist = abs(state.car_floor[i] - floor)
                 if dist < min_dist:
                     min_dist = dist
-                    best = car
-        return best
+                    best = i
+        return None if best is None else building.get_cars()[best]
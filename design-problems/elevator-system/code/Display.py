@@ -1,15 +1,27 @@
-from enums import Direction, ElevatorState
+from BuildingState import BuildingState, DIRECTIONS, ELEVATOR_STATES
 
 class Display:
-    def __init__(self):
-        self.floor = 0
-        self.direction = Direction.IDLE
-        self.state = ElevatorState.IDLE
+    def __init__(self, building_state=None, index=0):
+        self.building_state = building_state if building_state is not None else BuildingState(0, 1)
+        self.index = index
+
+    @property
+    def floor(self):
+        return self.building_state.display_floor[self.index]
+
+    @property
+    def direction(self):
+        return DIRECTIONS[self.building_state.display_direction[self.index]]
+
+    @property
+    def state(self):
+        return ELEVATOR_STATES[self.building_state.display_state[self.index]]
 
     def update(self, floor, direction, state):
-        self.floor = floor
-        self.direction = direction
-        self.state = state
+        s = self.building_state
+        s.display_floor[self.index] = floor
+        s.display_direction[self.index] = direction.value
+        s.display_state[self.index] = state.value
 
     def show(self, car_id):
         print(f"    Elevator {car_id} | Floor: {self.floor} | Direction: {self.direction.name} | State: {self.state.name}")
@@ -1,8 +1,18 @@
+from BuildingState import BuildingState, DOOR_STATES
 from enums import DoorState
 
 class Door:
-    def __init__(self):
-        self.state = DoorState.CLOSED
+    def __init__(self, building_state=None, index=0):
+        self.building_state = building_state if building_state is not None else BuildingState(0, 1)
+        self.index = index
+
+    @property
+    def state(self):
+        return DOOR_STATES[self.building_state.door_state[self.index]]
+
+    @state.setter
+    def state(self, value):
+        self.building_state.door_state[self.index] = value.value
 
     def open(self, car_id=None):
         self.state = DoorState.OPEN
@@ -1,8 +1,8 @@
 from Button import Button
 
 class ElevatorButton(Button):
-    def __init__(self, floor):
-        super().__init__()
+    def __init__(self, floor, bits=None, slot=0):
+        super().__init__(bits, slot, 1 << floor)
         self.destination_floor = floor
 
     def get_destination_floor(self):
@@ -1,4 +1,6 @@
+from functools import cached_property
 from enums import ElevatorState, Direction
+from BuildingState import BuildingState, ELEVATOR_STATES
 from Door import Door
 from Display import Display
 from ElevatorPanel import ElevatorPanel
@@ -6,26 +8,79 @@ from ElevatorPanel import ElevatorPanel
 class ElevatorCar:
     MAX_LOAD = 680  # kg
 
-    def __init__(self, car_id, num_floors):
+    def __init__(self, car_id, num_floors, building_state=None):
+        # A car is a view over slot `index` of the building state; on its
+        # own it gets a one-car state. The state starts IDLE on floor 0.
+        if building_state is None:
+            building_state = BuildingState(num_floors, 1)
+            self.index = 0
+        else:
+            self.index = car_id
         self.id = car_id
-        self.current_floor = 0
-        self.state = ElevatorState.IDLE
-        self.door = Door()
-        self.display = Display()
-        self.panel = ElevatorPanel(num_floors)
-        self.load = 0
-        self.overloaded = False
-        self.maintenance = False
-        self.update_display()
+        self.building_state = building_state
+
+    # Door, display and panel are only built when first used, which keeps
+    # fork() cheap for lookahead copies that never touch them.
+    @cached_property
+    def door(self):
+        return Door(self.building_state, self.index)
+
+    @cached_property
+    def display(self):
+        return Display(self.building_state, self.index)
+
+    @cached_property
+    def panel(self):
+        return ElevatorPanel(self.building_state.num_floors, self.building_state, self.index)
+
+    @property
+    def current_floor(self):
+        return self.building_state.car_floor[self.index]
+
+    @current_floor.setter
+    def current_floor(self, floor):
+        self.building_state.car_floor[self.index] = floor
+
+    @property
+    def state(self):
+        return ELEVATOR_STATES[self.building_state.car_state[self.index]]
+
+    @state.setter
+    def state(self, state):
+        self.building_state.car_state[self.index] = state.value
+
+    @property
+    def load(self):
+        return self.building_state.car_load[self.index]
+
+    @load.setter
+    def load(self, kg):
+        self.building_state.car_load[self.index] = kg
+
+    @property
+    def overloaded(self):
+        return bool(self.building_state.car_overloaded[self.index])
+
+    @overloaded.setter
+    def overloaded(self, flag):
+        self.building_state.car_overloaded[self.index] = flag
+
+    @property
+    def maintenance(self):
+        return bool(self.building_state.car_maintenance[self.index])
+
+    @maintenance.setter
+    def maintenance(self, flag):
+        self.building_state.car_maintenance[self.index] = flag
 
     def get_id(self):
         return self.id
 
     def get_current_floor(self):
-        return self.current_floor
+        return self.building_state.car_floor[self.index]
 
     def get_state(self):
-        return self.state
+        return ELEVATOR_STATES[self.building_state.car_state[self.index]]
 
     def get_door(self):
         return self.door
@@ -34,10 +89,10 @@ class ElevatorCar:
         return self.display
 
     def is_in_maintenance(self):
-        return self.maintenance
+        return bool(self.building_state.car_maintenance[self.index])
 
     def is_overloaded(self):
-        return self.overloaded
+        return bool(self.building_state.car_overloaded[self.index])
 
     def move(self, target):
         if self.maintenance:
@@ -92,13 +147,13 @@ class ElevatorCar:
         self.load += kg
         if self.load > ElevatorCar.MAX_LOAD:
             self.overloaded = True
-            print(f"  ALARM: Elevator {self.id} is overloaded! Current load: {self.load} kg (max: {ElevatorCar.MAX_LOAD} kg). Elevator will not move.")
+            print(f"  ALARM: Elevator {self.id} is overloaded! Current load: {self.load:g} kg (max: {ElevatorCar.MAX_LOAD} kg). Elevator will not move.")
 
     def remove_load(self, kg):
         self.load -= kg
         if self.load <= ElevatorCar.MAX_LOAD:
             self.overloaded = False
-            print(f"  Elevator {self.id}: Overload cleared. Current load: {self.load} kg.")
+            print(f"  Elevator {self.id}: Overload cleared. Current load: {self.load:g} kg.")
 
     def emergency_stop(self):
         self.state = ElevatorState.IDLE
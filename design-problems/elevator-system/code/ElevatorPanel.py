@@ -1,10 +1,15 @@
+from BuildingState import BuildingState, ViewList
 from ElevatorButton import ElevatorButton
 from DoorButton import DoorButton
 from EmergencyButton import EmergencyButton
 
 class ElevatorPanel:
-    def __init__(self, num_floors):
-        self.floor_buttons = [ElevatorButton(i) for i in range(num_floors)]
-        self.open_button = DoorButton()
-        self.close_button = DoorButton()
-        self.emergency_button = EmergencyButton()
+    def __init__(self, num_floors, building_state=None, car_index=0):
+        if building_state is None:
+            building_state = BuildingState(num_floors, 1)
+        car_buttons = building_state.car_buttons
+        # Floor buttons are created on access; their state is one bitmap per car
+        self.floor_buttons = ViewList(num_floors, lambda floor: ElevatorButton(floor, car_buttons, car_index))
+        self.open_button = DoorButton(building_state.door_buttons, car_index, 1)
+        self.close_button = DoorButton(building_state.door_buttons, car_index, 2)
+        self.emergency_button = EmergencyButton(building_state.emergency_buttons, car_index, 1)
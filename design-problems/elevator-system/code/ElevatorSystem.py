@@ -24,6 +24,9 @@ class ElevatorSystem:
             ElevatorSystem(num_floors, num_cars, dispatch_strategy)
         return ElevatorSystem._instance
 
+    def get_building(self):
+        return self.building
+
     def get_cars(self):
         return self.building.get_cars()
 
@@ -35,9 +38,7 @@ class ElevatorSystem:
         print("  Dispatcher running...")
         while self.hall_requests:
             req = self.hall_requests.popleft()
-            car = self.dispatch_strategy.select_car(
-                self.building.get_cars(), req.floor
-            )
+            car = self.dispatch_strategy.select_car(self.building, req.floor)
             if car is None:
                 print(f"  No available car for floor {req.floor}. Re-queuing request.")
                 self.hall_requests.append(req)
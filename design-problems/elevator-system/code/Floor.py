@@ -1,11 +1,14 @@
+from BuildingState import BuildingState
 from HallPanel import HallPanel
 from Display import Display
 
 class Floor:
-    def __init__(self, floor_number, top_floor):
+    def __init__(self, floor_number, top_floor, building_state=None):
+        if building_state is None:
+            building_state = BuildingState(top_floor + 1, 0)
         self.floor_number = floor_number
-        self.panel = HallPanel(floor_number, top_floor)
-        self.display = Display()
+        self.panel = HallPanel(floor_number, top_floor, building_state)
+        self.display = Display(building_state, building_state.floor_display_index(floor_number))
 
     def get_floor_number(self):
         return self.floor_number
@@ -1,8 +1,8 @@
 from Button import Button
 
 class HallButton(Button):
-    def __init__(self, direction):
-        super().__init__()
+    def __init__(self, direction, bits=None, slot=0, bit=1):
+        super().__init__(bits, slot, bit)
         self.direction = direction
 
     def get_direction(self):
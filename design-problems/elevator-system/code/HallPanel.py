@@ -2,9 +2,11 @@ from HallButton import HallButton
 from enums import Direction
 
 class HallPanel:
-    def __init__(self, floor_number, top_floor):
-        self.up = None if floor_number == top_floor else HallButton(Direction.UP)
-        self.down = None if floor_number == 0 else HallButton(Direction.DOWN)
+    def __init__(self, floor_number, top_floor, building_state=None):
+        bits = building_state.hall_buttons if building_state is not None else [0, 0]
+        bit = 1 << floor_number
+        self.up = None if floor_number == top_floor else HallButton(Direction.UP, bits, 0, bit)
+        self.down = None if floor_number == 0 else HallButton(Direction.DOWN, bits, 1, bit)
 
     def get_up_button(self):
         return self.up
@@ -1,4 +1,5 @@
 from ParkingLotSystem import ParkingLotSystem
+from Reservation import Reservation
 from Vehicle import Vehicle
 
 
@@ -6,5 +7,5 @@ class EntranceGate:
     def __init__(self, system: ParkingLotSystem):
         self.system = system
 
-    def enter(self, vehicle: Vehicle):
-        return self.system.handle_entry(vehicle)
+    def enter(self, vehicle: Vehicle, reservation: Reservation = None):
+        return self.system.handle_entry(vehicle, reservation)
@@ -0,0 +1,94 @@
+import mmap
+import struct
+import sys
+from array import array
+from itertools import repeat
+
+from SpotLayout import SpotLayout, SPOT_TYPES
+
+# Binary layout file: a header, then the spots stored column by column:
+# every spot id (int64), every type code (uint8), every level (int16), all
+# little-endian. Each column is read with a single array.frombytes() call.
+# Type codes are positions in VehicleType, so bump FORMAT_VERSION whenever
+# that enum is reordered or a member is removed.
+FORMAT_VERSION = 2
+LAYOUT_MAGIC = b"PLOT"
+LAYOUT_HEADER = struct.Struct("<4sHI")  # magic, format version, number of spots
+SPOT_RECORD_SIZE = 8 + 1 + 2  # bytes per spot: id, type code, level
+
+
+class LayoutLoader:
+    @staticmethod
+    def load_csv(path: str) -> SpotLayout:
+        # One spot per line: id,type,level  e.g. "12,CAR,0"
+        with open(path) as f:
+            text = f.read()
+        lines = text.splitlines()
+        if "#" in text or not all(map(str.strip, lines)):
+            lines = [line for line in lines if line.strip() and not line.lstrip().startswith("#")]
+        if any(count != 2 for count in set(map(str.count, lines, repeat(",")))):
+            raise ValueError(f"{path}: every line must be id,type,level.")
+        if not lines:
+            return SpotLayout()
+        # Split every line at once and take the columns as slices; no per-line Python code runs
+        fields = ",".join(lines).split(",")
+        codes = {spot_type.name: code for code, spot_type in enumerate(SPOT_TYPES)}
+        try:
+            type_codes = bytes(map(codes.__getitem__, map(str.strip, fields[1::3])))
+        except KeyError as e:
+            raise ValueError(f"{path}: unknown spot type {e.args[0]}.") from None
+        return SpotLayout(map(int, fields[0::3]), type_codes, map(int, fields[2::3]))
+
+    @staticmethod
+    def save_csv(spots, path: str):
+        layout = SpotLayout.of(spots)
+        names = [spot_type.name for spot_type in SPOT_TYPES]
+        with open(path, "w") as f:
+            f.writelines(f"{spot_id},{names[code]},{level}\n"
+                         for spot_id, code, level in zip(layout.ids, layout.codes, layout.levels))
+
+    @staticmethod
+    def load_binary(path: str) -> SpotLayout:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if len(mm) < LAYOUT_HEADER.size:
+                raise ValueError(f"{path} is not a parking lot layout file.")
+            magic, version, count = LAYOUT_HEADER.unpack_from(mm, 0)
+            if magic != LAYOUT_MAGIC:
+                raise ValueError(f"{path} is not a parking lot layout file.")
+            if version != FORMAT_VERSION:
+                raise ValueError(f"{path} has layout format version {version}, expected {FORMAT_VERSION}.")
+            return LayoutLoader.unpack_spots(mm, LAYOUT_HEADER.size, count)
+
+    @staticmethod
+    def save_binary(spots, path: str):
+        layout = SpotLayout.of(spots)
+        with open(path, "wb") as f:
+            f.write(LAYOUT_HEADER.pack(LAYOUT_MAGIC, FORMAT_VERSION, len(layout)))
+            f.write(LayoutLoader.pack_spots(layout))
+
+    @staticmethod
+    def pack_spots(spots) -> bytes:
+        layout = SpotLayout.of(spots)
+        ids, levels = array("q", layout.ids), array("h", layout.levels)
+        if sys.byteorder == "big":
+            ids.byteswap()
+            levels.byteswap()
+        return ids.tobytes() + bytes(layout.codes) + levels.tobytes()
+
+    @staticmethod
+    def unpack_spots(buf, start: int, count: int) -> SpotLayout:
+        if start + SPOT_RECORD_SIZE * count > len(buf):
+            raise ValueError(f"File is truncated: expected {count} spots but found fewer.")
+        ids, levels = array("q"), array("h")
+        with memoryview(buf) as view:
+            ids_end = start + 8 * count
+            codes_end = ids_end + count
+            ids.frombytes(view[start:ids_end])
+            codes = bytes(view[ids_end:codes_end])
+            levels.frombytes(view[codes_end:codes_end + 2 * count])
+        if sys.byteorder == "big":
+            ids.byteswap()
+            levels.byteswap()
+        if codes and max(codes) >= len(SPOT_TYPES):
+            raise ValueError(f"Unknown spot type code {max(codes)}.")
+        return SpotLayout(ids, codes, levels)
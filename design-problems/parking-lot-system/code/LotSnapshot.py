@@ -0,0 +1,107 @@
+import mmap
+import struct
+
+from LayoutLoader import LayoutLoader, FORMAT_VERSION, SPOT_RECORD_SIZE
+from ParkingLotSystem import ParkingLotSystem
+from ParkingTicket import ParkingTicket
+from Reservation import Reservation
+from SpotLayout import SPOT_TYPES, SPOT_TYPE_CODES
+from Vehicle import Vehicle
+
+# Snapshot file: header, spot columns (same format as a layout file),
+# one occupancy byte per spot, the reservations, then the active tickets.
+# Vehicle numbers follow their fixed-size record as UTF-8 bytes.
+SNAPSHOT_MAGIC = b"PSNP"
+SNAPSHOT_HEADER = struct.Struct("<4sHIII")  # magic, format version, spots, reservations, tickets
+RESERVATION_RECORD = struct.Struct("<IddH")  # spot index, start, end, vehicle number length
+TICKET_RECORD = struct.Struct("<IidBH")  # spot index, reservation index or -1, entry time, vehicle type, number length
+
+
+class LotSnapshot:
+    @staticmethod
+    def save(system: ParkingLotSystem, path: str):
+        spots = system.spots
+        # Only spots that were ever accessed can hold reservations
+        reservations = [r for spot in spots.materialized() for r in spot.reservations]
+        reservation_index = {id(r): i for i, r in enumerate(reservations)}
+        tickets = system.get_active_tickets()
+
+        with open(path, "wb") as f:
+            f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, FORMAT_VERSION, len(spots), len(reservations), len(tickets)))
+            f.write(LayoutLoader.pack_spots(spots))
+            f.write(spots.occupied)
+            for r in reservations:
+                number = r.get_vehicle_number().encode()
+                f.write(RESERVATION_RECORD.pack(
+                    r.get_spot().position, r.get_start_time(), r.get_end_time(), len(number)
+                ))
+                f.write(number)
+            for t in tickets:
+                vehicle = t.get_vehicle()
+                number = vehicle.get_number().encode()
+                f.write(TICKET_RECORD.pack(
+                    t.get_spot().position, reservation_index.get(id(t.get_reservation()), -1),
+                    t.get_entry_time(), SPOT_TYPE_CODES[vehicle.get_type()], len(number)
+                ))
+                f.write(number)
+
+    @staticmethod
+    def restore(system: ParkingLotSystem, path: str) -> list:
+        """Load a snapshot into an empty system and return the active tickets."""
+        if system.spots:
+            raise ValueError("Can only restore a snapshot into a parking lot with no spots.")
+
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if len(mm) < SNAPSHOT_HEADER.size:
+                raise ValueError(f"{path} is not a parking lot snapshot file.")
+            magic, version, num_spots, num_reservations, num_tickets = SNAPSHOT_HEADER.unpack_from(mm, 0)
+            if magic != SNAPSHOT_MAGIC:
+                raise ValueError(f"{path} is not a parking lot snapshot file.")
+            if version != FORMAT_VERSION:
+                raise ValueError(f"{path} has snapshot format version {version}, expected {FORMAT_VERSION}.")
+            offset = SNAPSHOT_HEADER.size
+            layout = LayoutLoader.unpack_spots(mm, offset, num_spots)
+            offset += SPOT_RECORD_SIZE * num_spots
+            if offset + num_spots > len(mm):
+                raise ValueError(f"{path} is truncated.")
+            layout.occupied[:] = mm[offset:offset + num_spots]
+            offset += num_spots
+
+            # Read every record before touching the system, so a damaged
+            # file leaves it empty
+            def read_record(record, offset):
+                if offset + record.size > len(mm):
+                    raise ValueError(f"{path} is truncated.")
+                *fields, length = record.unpack_from(mm, offset)
+                offset += record.size
+                if offset + length > len(mm):
+                    raise ValueError(f"{path} is truncated.")
+                if fields[0] >= num_spots:
+                    raise ValueError(f"{path} refers to spot {fields[0]}, but has only {num_spots} spots.")
+                return fields, mm[offset:offset + length].decode(), offset + length
+
+            reservations = []
+            for _ in range(num_reservations):
+                (spot_index, start, end), number, offset = read_record(RESERVATION_RECORD, offset)
+                reservations.append((spot_index, Reservation(number, None, start, end)))
+            ticket_rows = []
+            for _ in range(num_tickets):
+                fields, number, offset = read_record(TICKET_RECORD, offset)
+                if fields[1] >= num_reservations or fields[3] >= len(SPOT_TYPES):
+                    raise ValueError(f"{path} has a ticket with an unknown reservation or vehicle type.")
+                ticket_rows.append((fields, number))
+
+        # Spot objects are only created for spots with a reservation or a ticket
+        system.add_spots(layout)
+        spots = system.spots
+        for spot_index, reservation in reservations:
+            system.book(reservation, spots[spot_index])
+
+        tickets = []
+        for (spot_index, r_index, entry_time, type_code), number in ticket_rows:
+            vehicle = Vehicle(number, SPOT_TYPES[type_code])
+            reservation = reservations[r_index][1] if r_index >= 0 else None
+            ticket = ParkingTicket(vehicle, spots[spot_index], reservation, entry_time)
+            system.active_tickets[ticket.get_spot()] = ticket
+            tickets.append(ticket)
+        return tickets
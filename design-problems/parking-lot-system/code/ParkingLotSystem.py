@@ -5,16 +5,25 @@ from PaymentStrategy import PaymentStrategy
 from ParkingSpot import ParkingSpot
 from ParkingSpotFactory import ParkingSpotFactory
 from ParkingTicket import ParkingTicket
+from Reservation import Reservation
+from ReservationIndex import ReservationIndex
+from SpotLayout import SpotLayout
+from SpotTable import SpotTable
 from Vehicle import Vehicle
+from enums import VehicleType
 
 
 class ParkingLotSystem:
     _instance = None
+    WALK_IN_HOLD = 3600  # seconds a walk-in is assumed to stay when checking reservations
+    EARLY_ARRIVAL_GRACE = 900  # seconds before its start a booked vehicle may enter
 
     def __init__(self, pricing_service: PricingStrategy, payment_service: PaymentStrategy):
         if ParkingLotSystem._instance is not None:
             raise Exception("ParkingLotSystem is a Singleton. Use get_instance() instead.")
-        self.spots = []
+        self.spots = SpotTable()
+        self.reservations = ReservationIndex(self.spots)
+        self.active_tickets = {}  # {spot: ticket} for every parked vehicle
         self.pricing_service = pricing_service
         self.payment_service = payment_service
         ParkingLotSystem._instance = self
@@ -27,16 +36,88 @@ class ParkingLotSystem:
 
     def add_spot(self, spot: ParkingSpot):
         self.spots.append(spot)
+        for reservation in spot.reservations:
+            self.reservations.add(reservation)
+
+    def add_spots(self, spots):
+        if isinstance(spots, SpotLayout):
+            self.spots.extend(spots)  # ParkingSpot objects are created on first access
+            return
+        for spot in spots:
+            self.add_spot(spot)
+
+    def reserve(self, vehicle_number: str, vehicle_type: VehicleType, start_time: float, end_time: float):
+        Reservation.check_window(start_time, end_time)
+        required_type = ParkingSpotFactory.get_spot_type(vehicle_type)
+        now = time.time()
+        self.reservations.drop_expired(now)
+        # A walk-in may hold an occupied spot for WALK_IN_HOLD seconds, so a
+        # booking starting before then cannot go on an occupied spot.
+        starts_soon = start_time < now + ParkingLotSystem.WALK_IN_HOLD
+
+        spot = self.reservations.find_spot(required_type, start_time, end_time, must_be_free=starts_soon)
+        if spot is None:
+            return None  # every matching spot is booked for this window
+
+        reservation = Reservation(vehicle_number, spot, start_time, end_time)
+        self.book(reservation, spot)
+        return reservation
+
+    def book(self, reservation: Reservation, spot: ParkingSpot):
+        reservation.set_spot(spot)
+        spot.add_reservation(reservation)
+        self.reservations.add(reservation)
+
+    def cancel_reservation(self, reservation: Reservation):
+        spot = reservation.get_spot()
+        if spot.has_reservation(reservation):
+            spot.remove_reservation(reservation)
+            self.reservations.remove(reservation)
+
+    def handle_entry(self, vehicle: Vehicle, reservation: Reservation = None):
+        now = time.time()
+        self.reservations.drop_expired(now)
+
+        if reservation is not None:
+            if not self.can_use(reservation, vehicle, now):
+                return None  # reservation not valid for this vehicle right now
+            spot = reservation.get_spot()
+            start_time = reservation.get_start_time()
+            early = now < start_time
+            if not spot.available() or (early and spot.is_reserved(now, start_time)):
+                # The spot is still taken (e.g. a walk-in overstayed), so move
+                # the booking to another spot that is free from now on
+                spot = self.reservations.find_spot(
+                    spot.get_type(), min(now, start_time), reservation.get_end_time(), must_be_free=True
+                )
+                if spot is None:
+                    return None  # no matching spot available
+                self.cancel_reservation(reservation)
+                self.book(reservation, spot)
+            return self.issue_ticket(vehicle, spot, reservation)
 
-    def handle_entry(self, vehicle: Vehicle):
         required_type = ParkingSpotFactory.get_spot_type(vehicle.get_type())
+        spot = self.reservations.find_spot(
+            required_type, now, now + ParkingLotSystem.WALK_IN_HOLD, must_be_free=True
+        )
+        if spot is None:
+            return None  # no matching spot available
+        return self.issue_ticket(vehicle, spot)
+
+    def can_use(self, reservation: Reservation, vehicle: Vehicle, now: float) -> bool:
+        return (reservation.get_vehicle_number() == vehicle.get_number()
+                and reservation.get_spot().has_reservation(reservation)
+                and reservation.get_start_time() - ParkingLotSystem.EARLY_ARRIVAL_GRACE <= now
+                and now < reservation.get_end_time())
 
-        for spot in self.spots:
-            if spot.available() and spot.get_type() == required_type:
-                spot.mark_occupied()
-                return ParkingTicket(vehicle, spot)
+    def issue_ticket(self, vehicle: Vehicle, spot: ParkingSpot, reservation: Reservation = None):
+        spot.mark_occupied()
+        ticket = ParkingTicket(vehicle, spot, reservation)
+        self.active_tickets[spot] = ticket
+        return ticket
 
-        return None  # no matching spot available
+    def get_active_tickets(self) -> list:
+        return list(self.active_tickets.values())
 
     def handle_exit(self, ticket: ParkingTicket):
         fee = self.pricing_service.calculate_fee(
@@ -47,3 +128,6 @@ class ParkingLotSystem:
 
         if self.payment_service.process_payment(fee):
             ticket.get_spot().release()
+            self.active_tickets.pop(ticket.get_spot(), None)
+            if ticket.get_reservation() is not None:
+                self.cancel_reservation(ticket.get_reservation())
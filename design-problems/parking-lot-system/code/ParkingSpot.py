@@ -1,11 +1,22 @@
+from bisect import bisect_right
+
 from enums import VehicleType
 
 
 class ParkingSpot:
-    def __init__(self, spot_id: int, spot_type: VehicleType):
+    def __init__(self, spot_id: int, spot_type: VehicleType, level: int = 0):
         self.id = spot_id
         self.type = spot_type
+        self.level = level
         self.is_free = True
+        # Reservations on one spot never overlap, so keeping them sorted by
+        # start time is enough for an O(log N) conflict check: only the
+        # neighbours around the insertion point can clash with a new window.
+        self.reservation_starts = []
+        self.reservations = []
+        # Set when the spot joins a lot, so occupancy changes reach the lot's SpotTable
+        self.table = None
+        self.position = 0
 
     def available(self) -> bool:
         return self.is_free
@@ -15,9 +26,41 @@ class ParkingSpot:
 
     def mark_occupied(self):
         self.is_free = False
+        if self.table is not None:
+            self.table.set_occupied(self.position, True)
 
     def release(self):
         self.is_free = True
+        if self.table is not None:
+            self.table.set_occupied(self.position, False)
 
     def get_id(self) -> int:
         return self.id
+
+    def get_level(self) -> int:
+        return self.level
+
+    def is_reserved(self, start_time: float, end_time: float) -> bool:
+        i = bisect_right(self.reservation_starts, start_time)
+        if i > 0 and self.reservations[i - 1].get_end_time() > start_time:
+            return True
+        return i < len(self.reservations) and self.reservation_starts[i] < end_time
+
+    def add_reservation(self, reservation) -> bool:
+        start_time = reservation.get_start_time()
+        if self.is_reserved(start_time, reservation.get_end_time()):
+            return False
+        i = bisect_right(self.reservation_starts, start_time)
+        self.reservation_starts.insert(i, start_time)
+        self.reservations.insert(i, reservation)
+        return True
+
+    def has_reservation(self, reservation) -> bool:
+        i = bisect_right(self.reservation_starts, reservation.get_start_time()) - 1
+        return i >= 0 and self.reservations[i] is reservation
+
+    def remove_reservation(self, reservation):
+        if self.has_reservation(reservation):
+            i = bisect_right(self.reservation_starts, reservation.get_start_time()) - 1
+            del self.reservation_starts[i]
+            del self.reservations[i]
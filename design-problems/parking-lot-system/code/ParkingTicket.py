@@ -5,10 +5,11 @@ from ParkingSpot import ParkingSpot
 
 
 class ParkingTicket:
-    def __init__(self, vehicle: Vehicle, spot: ParkingSpot):
+    def __init__(self, vehicle: Vehicle, spot: ParkingSpot, reservation=None, entry_time: float = None):
         self.vehicle = vehicle
         self.spot = spot
-        self.entry_time = time.time()
+        self.reservation = reservation
+        self.entry_time = entry_time if entry_time is not None else time.time()
 
     def get_vehicle(self) -> Vehicle:
         return self.vehicle
@@ -16,5 +17,8 @@ class ParkingTicket:
     def get_spot(self) -> ParkingSpot:
         return self.spot
 
+    def get_reservation(self):
+        return self.reservation
+
     def get_entry_time(self) -> float:
         return self.entry_time
@@ -0,0 +1,30 @@
+from ParkingSpot import ParkingSpot
+
+
+class Reservation:
+    def __init__(self, vehicle_number: str, spot: ParkingSpot, start_time: float, end_time: float):
+        Reservation.check_window(start_time, end_time)
+        self.vehicle_number = vehicle_number
+        self.spot = spot
+        self.start_time = start_time
+        self.end_time = end_time
+
+    def get_vehicle_number(self) -> str:
+        return self.vehicle_number
+
+    def get_spot(self) -> ParkingSpot:
+        return self.spot
+
+    def set_spot(self, spot: ParkingSpot):
+        self.spot = spot
+
+    def get_start_time(self) -> float:
+        return self.start_time
+
+    def get_end_time(self) -> float:
+        return self.end_time
+
+    @staticmethod
+    def check_window(start_time: float, end_time: float):
+        if end_time <= start_time:
+            raise ValueError("Reservation must end after it starts.")
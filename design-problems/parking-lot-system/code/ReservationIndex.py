@@ -0,0 +1,75 @@
+import heapq
+import math
+
+from Reservation import Reservation
+from SpotTable import SpotTable
+from enums import VehicleType
+
+
+class ReservationIndex:
+    SLOT = 900  # seconds per time slot
+
+    # Time is cut into slots, and each slot has a bitmask of the spot
+    # positions that have a reservation touching it. OR-ing the masks of a
+    # window's slots gives every spot that might be busy, so finding a free
+    # spot never has to visit the spots that are booked.
+    def __init__(self, table: SpotTable):
+        self.table = table
+        self.slot_masks = {}  # {slot number: bitmask of spot positions}
+        self.expiry = []  # heap of (end_time, counter, reservation)
+        self.counter = 0
+
+    def slot_range(self, start_time: float, end_time: float) -> range:
+        return range(int(start_time // self.SLOT), math.ceil(end_time / self.SLOT))
+
+    def add(self, reservation: Reservation):
+        bit = 1 << reservation.get_spot().position
+        for k in self.slot_range(reservation.get_start_time(), reservation.get_end_time()):
+            self.slot_masks[k] = self.slot_masks.get(k, 0) | bit
+        heapq.heappush(self.expiry, (reservation.get_end_time(), self.counter, reservation))
+        self.counter += 1
+
+    def remove(self, reservation: Reservation):
+        # Call after the reservation has been removed from its spot
+        spot = reservation.get_spot()
+        bit = 1 << spot.position
+        slots = self.slot_range(reservation.get_start_time(), reservation.get_end_time())
+        for k in slots:
+            mask = self.slot_masks.get(k, 0) & ~bit
+            # The spot's neighbouring reservations may share the edge slots
+            if k in (slots[0], slots[-1]) and spot.is_reserved(k * self.SLOT, (k + 1) * self.SLOT):
+                mask |= bit
+            if mask:
+                self.slot_masks[k] = mask
+            else:
+                self.slot_masks.pop(k, None)
+
+    def drop_expired(self, now: float):
+        # Cancelled reservations also sit in the heap; they are skipped here
+        while self.expiry and self.expiry[0][0] <= now:
+            reservation = heapq.heappop(self.expiry)[2]
+            spot = reservation.get_spot()
+            if spot.has_reservation(reservation):
+                spot.remove_reservation(reservation)
+                self.remove(reservation)
+
+    def find_spot(self, spot_type: VehicleType, start_time: float, end_time: float, must_be_free: bool):
+        busy = 0  # a reservation touches one of the window's slots
+        surely_busy = 0  # a reservation touches a slot lying wholly inside the window
+        for k in self.slot_range(start_time, end_time):
+            mask = self.slot_masks.get(k, 0)
+            busy |= mask
+            if k * self.SLOT >= start_time and (k + 1) * self.SLOT <= end_time:
+                surely_busy |= mask
+
+        candidates = self.table.candidates(spot_type, must_be_free)
+        # Spots with no reservation near the window first, then the ones that
+        # only share an edge slot with some reservation and need an exact check
+        for mask in (candidates & ~busy, candidates & busy & ~surely_busy):
+            while mask:
+                lowest = mask & -mask
+                spot = self.table[lowest.bit_length() - 1]
+                if not spot.is_reserved(start_time, end_time):
+                    return spot
+                mask ^= lowest
+        return None
@@ -0,0 +1,55 @@
+from array import array
+from collections.abc import Sequence
+
+from ParkingSpot import ParkingSpot
+from enums import VehicleType
+
+# Type codes are positions in VehicleType
+SPOT_TYPES = list(VehicleType)
+SPOT_TYPE_CODES = {spot_type: code for code, spot_type in enumerate(SPOT_TYPES)}
+MIN_LEVEL, MAX_LEVEL = -2 ** 15, 2 ** 15 - 1
+
+
+class SpotLayout(Sequence):
+    # The spots of a lot as columns: ids, type codes, levels and occupancy.
+    # A million spots take about 12 MB this way instead of ~300 MB of
+    # ParkingSpot objects, so loaders return a SpotLayout and spot objects
+    # are only created when they are asked for.
+    LEVEL_ERROR = f"Spot levels must be between {MIN_LEVEL} and {MAX_LEVEL}."
+
+    def __init__(self, ids=(), codes=b"", levels=(), occupied=None):
+        self.ids = array("q", ids)
+        self.codes = bytearray(codes)
+        try:
+            self.levels = array("h", levels)
+        except OverflowError:
+            raise ValueError(SpotLayout.LEVEL_ERROR) from None
+        self.occupied = bytearray(occupied) if occupied is not None else bytearray(len(self.ids))
+        if not len(self.ids) == len(self.codes) == len(self.levels) == len(self.occupied):
+            raise ValueError("Every spot needs an id, a type, a level and an occupancy flag.")
+
+    @staticmethod
+    def of(spots) -> "SpotLayout":
+        if isinstance(spots, SpotLayout):
+            return spots
+        return SpotLayout(
+            [s.get_id() for s in spots],
+            bytes(SPOT_TYPE_CODES[s.get_type()] for s in spots),
+            [s.get_level() for s in spots],
+            bytes(not s.available() for s in spots),
+        )
+
+    @staticmethod
+    def check_level(level: int):
+        if not MIN_LEVEL <= level <= MAX_LEVEL:
+            raise ValueError(SpotLayout.LEVEL_ERROR)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        spot = ParkingSpot(self.ids[i], SPOT_TYPES[self.codes[i]], self.levels[i])
+        spot.is_free = not self.occupied[i]
+        return spot
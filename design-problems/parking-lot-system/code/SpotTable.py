@@ -0,0 +1,74 @@
+from ParkingSpot import ParkingSpot
+from SpotLayout import SpotLayout, SPOT_TYPES, SPOT_TYPE_CODES
+from enums import VehicleType
+
+
+def flags_to_mask(flags: bytes, value: int) -> int:
+    # Bit i of the result is set where flags[i] == value. translate() and
+    # int(..., 2) both run in C, so this is fast even for a million spots.
+    if not flags:
+        return 0
+    digits = flags.translate(bytes(ord("1") if b == value else ord("0") for b in range(256)))
+    return int(digits[::-1], 2)
+
+
+class SpotTable(SpotLayout):
+    # All spots of a lot, in the order they were added. The columns of
+    # SpotLayout hold every spot; a ParkingSpot object is created the first
+    # time a spot is accessed and kept from then on. From the type codes and
+    # occupancy, bitmasks over spot positions answer "which CAR spots are
+    # free" without a scan.
+    def __init__(self):
+        super().__init__()
+        self.spots = []  # ParkingSpot objects, or None until first accessed
+        self.type_masks = {}
+        self.free_mask = 0
+        self.masks_dirty = False
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        spot = self.spots[i]
+        if spot is None:
+            spot = super().__getitem__(i)
+            spot.table = self
+            spot.position = i % len(self)
+            self.spots[i] = spot
+        return spot
+
+    def materialized(self) -> list:
+        return [spot for spot in self.spots if spot is not None]
+
+    def append(self, spot: ParkingSpot):
+        SpotLayout.check_level(spot.get_level())
+        spot.table = self
+        spot.position = len(self.spots)
+        self.spots.append(spot)
+        self.ids.append(spot.get_id())
+        self.codes.append(SPOT_TYPE_CODES[spot.get_type()])
+        self.levels.append(spot.get_level())
+        self.occupied.append(not spot.available())
+        self.masks_dirty = True
+
+    def extend(self, layout: SpotLayout):
+        self.spots.extend([None] * len(layout))
+        self.ids.extend(layout.ids)
+        self.codes.extend(layout.codes)
+        self.levels.extend(layout.levels)
+        self.occupied.extend(layout.occupied)
+        self.masks_dirty = True
+
+    def set_occupied(self, position: int, occupied: bool):
+        self.occupied[position] = occupied
+        if not self.masks_dirty:
+            bit = 1 << position
+            self.free_mask = self.free_mask & ~bit if occupied else self.free_mask | bit
+
+    def candidates(self, spot_type: VehicleType, must_be_free: bool) -> int:
+        # Masks are rebuilt in one go after spots are added, not per spot
+        if self.masks_dirty:
+            self.type_masks = {t: flags_to_mask(self.codes, code) for code, t in enumerate(SPOT_TYPES)}
+            self.free_mask = flags_to_mask(self.occupied, 0)
+            self.masks_dirty = False
+        mask = self.type_masks.get(spot_type, 0)
+        return mask & self.free_mask if must_be_free else mask
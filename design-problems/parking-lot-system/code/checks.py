@@ -0,0 +1,261 @@
+import io
+import os
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+from enums import VehicleType
+from Vehicle import Vehicle
+from ParkingSpot import ParkingSpot
+from ParkingLotSystem import ParkingLotSystem
+from Reservation import Reservation
+from HourlyPricing import HourlyPricing
+from CashPayment import CashPayment
+from LayoutLoader import LayoutLoader, LAYOUT_HEADER
+from LotSnapshot import LotSnapshot, SNAPSHOT_HEADER
+
+# Runnable checks in the style of main.py: python checks.py
+
+HOUR = 3600
+RATES = {VehicleType.BIKE: 20, VehicleType.CAR: 50, VehicleType.TRUCK: 100}
+
+
+def empty_lot() -> ParkingLotSystem:
+    ParkingLotSystem._instance = None
+    return ParkingLotSystem.get_instance(HourlyPricing(RATES), CashPayment())
+
+
+def new_lot(num_car_spots: int) -> ParkingLotSystem:
+    system = empty_lot()
+    for i in range(num_car_spots):
+        system.add_spot(ParkingSpot(i, VehicleType.CAR))
+    system.add_spot(ParkingSpot(num_car_spots, VehicleType.BIKE))
+    return system
+
+
+def car(number: str) -> Vehicle:
+    return Vehicle(number, VehicleType.CAR)
+
+
+def raises_value_error(action) -> bool:
+    try:
+        action()
+    except ValueError:
+        return True
+    return False
+
+
+def damaged_copy(path: str, new_path: str, offset: int = None, data: bytes = b"", truncate: int = None) -> str:
+    with open(path, "rb") as f:
+        content = bytearray(f.read())
+    if offset is not None:
+        content[offset:offset + len(data)] = data
+    if truncate is not None:
+        del content[truncate:]
+    with open(new_path, "wb") as f:
+        f.write(content)
+    return new_path
+
+
+def check_half_open_windows():
+    spot = ParkingSpot(1, VehicleType.CAR)
+    assert spot.add_reservation(Reservation("A", spot, 100, 200))
+    assert spot.add_reservation(Reservation("B", spot, 200, 300))  # touching end/start is fine
+    assert spot.add_reservation(Reservation("C", spot, 50, 100))
+    assert not spot.add_reservation(Reservation("D", spot, 199, 201))
+    assert not spot.add_reservation(Reservation("E", spot, 0, 1000))
+    assert not spot.add_reservation(Reservation("F", spot, 120, 130))
+    assert spot.is_reserved(99, 101) and not spot.is_reserved(300, 400) and not spot.is_reserved(0, 50)
+
+
+def check_invalid_windows():
+    system = new_lot(1)
+    now = time.time()
+    for start, end in ((now + 10, now + 10), (now + 10, now)):
+        try:
+            system.reserve("A", VehicleType.CAR, start, end)
+        except ValueError:
+            continue
+        raise AssertionError("empty or inverted window was accepted")
+
+
+def check_pool_saturation():
+    system = new_lot(50)
+    tomorrow = time.time() + 24 * HOUR
+    booked = [system.reserve(f"CORP-{i}", VehicleType.CAR, tomorrow, tomorrow + 9 * HOUR) for i in range(50)]
+    assert len({r.get_spot().get_id() for r in booked}) == 50
+    assert system.reserve("LATE", VehicleType.CAR, tomorrow + HOUR, tomorrow + 2 * HOUR) is None
+    # Windows that only share a slot edge with the bookings still fit
+    assert system.reserve("EVENING", VehicleType.CAR, tomorrow + 9 * HOUR, tomorrow + 10 * HOUR)
+    system.cancel_reservation(booked[7])
+    again = system.reserve("AGAIN", VehicleType.CAR, tomorrow, tomorrow + HOUR)
+    assert again.get_spot() is booked[7].get_spot()
+
+
+def check_shared_edge_slot():
+    system = new_lot(1)
+    base = (int(time.time()) // 900 + 100) * 900  # slot-aligned, well in the future
+    first = system.reserve("A", VehicleType.CAR, base, base + 400)
+    second = system.reserve("B", VehicleType.CAR, base + 400, base + 800)  # same 15 min slot
+    assert first and second
+    system.cancel_reservation(first)
+    assert system.reserve("C", VehicleType.CAR, base + 500, base + 600) is None
+    assert system.reserve("D", VehicleType.CAR, base, base + 400)
+
+
+def check_expired_reservations_are_dropped():
+    system = new_lot(1)
+    now = time.time()
+    spot = system.spots[0]
+    for i in range(3):
+        spot.add_reservation(Reservation(f"OLD-{i}", spot, now - 500 + i * 100, now - 450 + i * 100))
+    current = Reservation("NOW", spot, now - 10, now + HOUR)
+    future = Reservation("LATER", spot, now + 2 * HOUR, now + 3 * HOUR)
+    for r in (current, future):
+        system.book(r, spot)
+    for r in spot.reservations[:3]:
+        system.reservations.add(r)
+    system.reserve("X", VehicleType.CAR, now + 5 * HOUR, now + 6 * HOUR)
+    assert [r.get_vehicle_number() for r in spot.reservations] == ["NOW", "LATER", "X"]
+
+
+def check_cancelled_and_used_reservations():
+    system = new_lot(2)
+    now = time.time()
+    first = system.reserve("A", VehicleType.CAR, now, now + HOUR)
+    system.cancel_reservation(first)
+    second = system.reserve("B", VehicleType.CAR, now, now + HOUR)
+    assert system.handle_entry(car("A"), first) is None
+    ticket = system.handle_entry(car("B"), second)
+    assert ticket is not None
+    system.handle_exit(ticket)
+    assert system.handle_entry(car("B"), second) is None
+
+
+def check_walk_ins_and_bookings_starting_soon():
+    system = new_lot(2)
+    now = time.time()
+    booking = system.reserve("A", VehicleType.CAR, now + 600, now + 2 * HOUR)
+    walk_in = system.handle_entry(car("W"))
+    assert walk_in.get_spot() is not booking.get_spot()
+    assert system.handle_entry(car("W2")) is None
+    assert system.reserve("B", VehicleType.CAR, now + 300, now + HOUR) is None  # only spot left is taken
+
+
+def check_early_arrival():
+    system = new_lot(2)
+    now = time.time()
+    too_early = system.reserve("A", VehicleType.CAR, now + 2 * HOUR, now + 4 * HOUR)
+    assert system.handle_entry(car("A"), too_early) is None
+    slightly_early = system.reserve("B", VehicleType.CAR, now + 300, now + HOUR)
+    ticket = system.handle_entry(car("B"), slightly_early)
+    assert ticket is not None and ticket.get_spot() is slightly_early.get_spot()
+
+
+def check_overstayed_walk_in_moves_booking():
+    system = new_lot(3)
+    now = time.time()
+    booking = system.reserve("A", VehicleType.CAR, now + 300, now + 2 * HOUR)
+    booked_spot = booking.get_spot()
+    booked_spot.mark_occupied()  # a walk-in let in hours ago is still there
+    ticket = system.handle_entry(car("A"), booking)
+    assert ticket is not None and ticket.get_spot() is not booked_spot
+    assert booking.get_spot() is ticket.get_spot() and not booked_spot.reservations
+    system.handle_exit(ticket)
+    assert not ticket.get_spot().reservations
+
+
+def check_layout_files():
+    spots = [ParkingSpot(7, VehicleType.CAR, -1), ParkingSpot(8, VehicleType.TRUCK, 3), ParkingSpot(9, VehicleType.BIKE)]
+    with tempfile.TemporaryDirectory() as workdir:
+        csv_path, bin_path = os.path.join(workdir, "lot.csv"), os.path.join(workdir, "lot.bin")
+        LayoutLoader.save_csv(spots, csv_path)
+        LayoutLoader.save_binary(spots, bin_path)
+        for layout in (LayoutLoader.load_csv(csv_path), LayoutLoader.load_binary(bin_path)):
+            assert [(s.get_id(), s.get_type(), s.get_level()) for s in layout] == \
+                   [(7, VehicleType.CAR, -1), (8, VehicleType.TRUCK, 3), (9, VehicleType.BIKE, 0)]
+        system = empty_lot()
+        system.add_spots(LayoutLoader.load_binary(bin_path))
+        assert system.handle_entry(Vehicle("T", VehicleType.TRUCK)).get_spot().get_id() == 8
+
+        assert raises_value_error(lambda: LayoutLoader.save_binary([ParkingSpot(1, VehicleType.CAR, 40000)], bin_path))
+        assert raises_value_error(lambda: empty_lot().add_spot(ParkingSpot(1, VehicleType.CAR, -40000)))
+        short = damaged_copy(bin_path, os.path.join(workdir, "short.bin"), truncate=LAYOUT_HEADER.size + 20)
+        assert raises_value_error(lambda: LayoutLoader.load_binary(short))
+
+
+def check_snapshot_round_trip():
+    system = new_lot(3)
+    now = time.time()
+    booking = system.reserve("A", VehicleType.CAR, now, now + 2 * HOUR)
+    later = system.reserve("B", VehicleType.CAR, now + 5 * HOUR, now + 6 * HOUR)
+    booked_ticket = system.handle_entry(car("A"), booking)
+    walk_in = system.handle_entry(Vehicle("W", VehicleType.BIKE))
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "lot.snap")
+        LotSnapshot.save(system, path)
+        restored = empty_lot()
+        tickets = LotSnapshot.restore(restored, path)
+
+    assert [s.available() for s in restored.spots] == [s.available() for s in system.spots]
+    by_number = {t.get_vehicle().get_number(): t for t in tickets}
+    assert by_number["W"].get_reservation() is None
+    assert by_number["W"].get_spot().get_id() == walk_in.get_spot().get_id()
+    ticket = by_number["A"]
+    reservation = ticket.get_reservation()
+    assert reservation.get_spot() is ticket.get_spot()
+    assert ticket.get_spot().get_id() == booked_ticket.get_spot().get_id()
+    assert ticket.get_entry_time() == booked_ticket.get_entry_time()
+    assert ticket.get_spot().has_reservation(reservation)
+    moved = [r for s in restored.spots.materialized() for r in s.reservations if r.get_vehicle_number() == "B"]
+    assert len(moved) == 1 and moved[0].get_spot().get_id() == later.get_spot().get_id()
+
+    restored.handle_exit(ticket)
+    assert ticket.get_spot().available() and not ticket.get_spot().has_reservation(reservation)
+    assert restored.get_active_tickets() == [by_number["W"]]
+
+
+def check_snapshot_rejects_bad_files():
+    system = new_lot(2)
+    now = time.time()
+    system.handle_entry(car("A"), system.reserve("A", VehicleType.CAR, now, now + HOUR))
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "lot.snap")
+        LotSnapshot.save(system, path)
+        size = os.path.getsize(path)
+        bad_files = [
+            damaged_copy(path, os.path.join(workdir, "magic.snap"), 0, b"PLOT"),
+            damaged_copy(path, os.path.join(workdir, "version.snap"), 4, b"\x09\x00"),
+            damaged_copy(path, os.path.join(workdir, "header.snap"), truncate=SNAPSHOT_HEADER.size - 1),
+            damaged_copy(path, os.path.join(workdir, "spots.snap"), truncate=SNAPSHOT_HEADER.size + 5),
+            damaged_copy(path, os.path.join(workdir, "ticket.snap"), truncate=size - 1),
+        ]
+        for bad in bad_files:
+            empty = empty_lot()
+            assert raises_value_error(lambda: LotSnapshot.restore(empty, bad)), bad
+            assert not empty.spots and not empty.get_active_tickets()
+        assert raises_value_error(lambda: LotSnapshot.restore(system, path))
+
+
+CHECKS = [
+    check_half_open_windows,
+    check_invalid_windows,
+    check_pool_saturation,
+    check_shared_edge_slot,
+    check_expired_reservations_are_dropped,
+    check_cancelled_and_used_reservations,
+    check_walk_ins_and_bookings_starting_soon,
+    check_early_arrival,
+    check_overstayed_walk_in_moves_booking,
+    check_layout_files,
+    check_snapshot_round_trip,
+    check_snapshot_rejects_bad_files,
+]
+
+
+if __name__ == "__main__":
+    for check in CHECKS:
+        with redirect_stdout(io.StringIO()):  # payments print a receipt line
+            check()
+        print(f"  ok  {check.__name__}")
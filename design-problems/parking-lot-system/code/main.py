@@ -1,3 +1,6 @@
+import time
+from datetime import datetime, timedelta
+
 from enums import VehicleType
 from Vehicle import Vehicle
 from ParkingSpot import ParkingSpot
@@ -49,3 +52,28 @@ if __name__ == "__main__":
     if ticket2:
         exit_gate.exit(ticket2)
         print(f"  Spot {ticket2.get_spot().get_id()} is now free: {ticket2.get_spot().available()}")
+
+
+    print("--- Corporate booking for tomorrow 09:00-18:00 ---")
+    tomorrow = datetime.now() + timedelta(days=1)
+    tomorrow_9am = tomorrow.replace(hour=9, minute=0, second=0, microsecond=0).timestamp()
+    booking = system.reserve("KA-02-4321", VehicleType.CAR, tomorrow_9am, tomorrow_9am + 9 * 3600)
+    if booking:
+        print(f"  Spot {booking.get_spot().get_id()} reserved for {booking.get_vehicle_number()}")
+
+    print("--- Booking the car spots for right now ---")
+    now = time.time()
+    booking1 = system.reserve("KA-03-1111", VehicleType.CAR, now, now + 2 * 3600)
+    system.reserve("KA-04-2222", VehicleType.CAR, now, now + 2 * 3600)
+
+    print("--- Walk-in car entering ---")
+    walk_in = Vehicle("KA-09-5555", VehicleType.CAR)
+    ticket3 = entrance.enter(walk_in)
+    print(f"  Walk-in car parked: {ticket3 is not None}")
+
+    print("--- Reserved car entering ---")
+    booked_car = Vehicle("KA-03-1111", VehicleType.CAR)
+    ticket4 = entrance.enter(booked_car, booking1)
+    if ticket4:
+        print(f"  Reserved car parked at spot {ticket4.get_spot().get_id()}")
+        exit_gate.exit(ticket4)